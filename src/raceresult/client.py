@@ -9,6 +9,7 @@ from typing import Any
 from urllib.parse import urlencode
 
 import httpx
+from pydantic_core import from_json
 
 
 class RaceResultError(Exception):
@@ -103,18 +104,22 @@ class RaceResultClient:
 
         url = "".join(url_parts)
         if params:
-            # Filter out None values and convert to strings
-            filtered_params = {
-                k: self._serialize_param(v) for k, v in params.items() if v is not None
-            }
-            if filtered_params:
-                url += "?" + urlencode(filtered_params)
+            # Filter out None values and encode the pairs directly, without an
+            # intermediate dict
+            query = [(k, self._serialize_param(v)) for k, v in params.items() if v is not None]
+            if query:
+                url += "?" + urlencode(query)
         return url
 
     def _serialize_param(self, value: Any) -> str:
         """Serialize a parameter value to string."""
+        if isinstance(value, str):
+            return value
         if isinstance(value, bool):
             return "true" if value else "false"
+        if isinstance(value, int):
+            # int() so IntEnum members are sent as numbers on every Python version
+            return str(int(value))
         if isinstance(value, (list, tuple)):
             return ",".join(str(v) for v in value)
         return str(value)
@@ -282,10 +287,8 @@ class RaceResultClient:
         self, event_id: str | None, cmd: str, params: dict[str, Any] | None = None
     ) -> Any:
         """Make a GET request and parse JSON response."""
-        import json
-
         content = await self.get(event_id, cmd, params)
-        return json.loads(content)
+        return from_json(content)
 
     async def post_json(
         self,
@@ -295,9 +298,7 @@ class RaceResultClient:
         data: Any = None,
     ) -> Any:
         """Make a POST request and parse JSON response."""
-        import json
-
         content = await self.post(event_id, cmd, params, data)
         if content:
-            return json.loads(content)
+            return from_json(content)
         return None
@@ -5,7 +5,9 @@ Based on go-webapi/eventapi_contests.go.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
+
+from pydantic import TypeAdapter
 
 from raceresult.models.event import Contest
 
@@ -13,6 +15,10 @@ if TYPE_CHECKING:
     from raceresult.client import RaceResultClient
 
 
+# Built once so contests/get responses are validated straight from the body bytes.
+_CONTESTS_ADAPTER = TypeAdapter(Optional[list[Contest]])
+
+
 class ContestsEndpoint:
     """Contests API endpoint.
 
@@ -53,10 +59,8 @@ class ContestsEndpoint:
         Returns:
             List of all contests
         """
-        result = await self._client.get_json(self._event_id, "contests/get")
-        if not result:
-            return []
-        return [Contest.model_validate(item) for item in result]
+        content = await self._client.get(self._event_id, "contests/get")
+        return _CONTESTS_ADAPTER.validate_json(content) or []
 
     async def get_one(self, id: int) -> Contest:
         """Get a single contest by ID.
@@ -70,8 +74,8 @@ class ContestsEndpoint:
             Contest object
         """
         params = {"id": id}
-        result = await self._client.get_json(self._event_id, "contests/get", params)
-        return Contest.model_validate(result)
+        content = await self._client.get(self._event_id, "contests/get", params)
+        return Contest.model_validate_json(content)
 
     async def delete(self, id: int) -> None:
         """Delete a contest.
@@ -5,6 +5,8 @@ Based on go-webapi/eventapi_data.go.
 
 from __future__ import annotations
 
+import builtins
+from collections.abc import AsyncIterator
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -94,6 +96,94 @@ class DataEndpoint:
         result = await self._client.get_json(self._event_id, "data/list", params)
         return result if result else []
 
+    async def columns(
+        self,
+        fields: builtins.list[str],
+        filter_expr: str = "",
+        sort: builtins.list[str] | None = None,
+        limit_from: int = 0,
+        limit_to: int = 0,
+        multiplier_field: str = "",
+        selector_result: str = "",
+    ) -> dict[str, builtins.list[Any]]:
+        """Get arbitrary records as one list of values per field.
+
+        Same query as list(), transposed so that a single field (e.g. all
+        bibs or emails) can be used without walking every row.
+
+        Args:
+            fields: Field expressions to retrieve
+            filter_expr: Filter expression
+            sort: Sort expressions
+            limit_from: Starting row (0-based)
+            limit_to: Ending row (exclusive, 0 for no limit)
+            multiplier_field: Field for row multiplication
+            selector_result: Result selector
+
+        Returns:
+            Dictionary mapping each field expression to its column of values
+        """
+        rows = await self.list(
+            fields,
+            filter_expr=filter_expr,
+            sort=sort,
+            limit_from=limit_from,
+            limit_to=limit_to,
+            multiplier_field=multiplier_field,
+            selector_result=selector_result,
+        )
+        if not rows:
+            return {field: [] for field in fields}
+        return {field: builtins.list(column) for field, column in zip(fields, zip(*rows))}
+
+    async def iter_rows(
+        self,
+        fields: builtins.list[str],
+        filter_expr: str = "",
+        sort: builtins.list[str] | None = None,
+        page_size: int = 1000,
+        multiplier_field: str = "",
+        selector_result: str = "",
+    ) -> AsyncIterator[builtins.list[Any]]:
+        """Iterate over records, fetching them page by page.
+
+        Issues list() requests of page_size rows until a short page comes
+        back, so only one page is held in memory at a time. Pass a sort
+        expression (e.g. ["ID"]) to keep the order stable across pages.
+
+        Args:
+            fields: Field expressions to retrieve
+            filter_expr: Filter expression
+            sort: Sort expressions
+            page_size: Number of rows per request
+            multiplier_field: Field for row multiplication
+            selector_result: Result selector
+
+        Yields:
+            Rows, each row is a list of field values
+
+        Raises:
+            ValueError: If page_size is not positive
+        """
+        if page_size <= 0:
+            raise ValueError(f"page_size must be positive, got {page_size}")
+        start = 0
+        while True:
+            rows = await self.list(
+                fields,
+                filter_expr=filter_expr,
+                sort=sort,
+                limit_from=start,
+                limit_to=start + page_size,
+                multiplier_field=multiplier_field,
+                selector_result=selector_result,
+            )
+            for row in rows:
+                yield row
+            if len(rows) < page_size:
+                return
+            start += page_size
+
     async def transformation(
         self,
         col_field: str,
@@ -5,7 +5,9 @@ Based on go-webapi/eventapi_emailtemplates.go.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
+
+from pydantic import TypeAdapter
 
 from raceresult.models.email import EmailTemplate, Preview
 
@@ -13,6 +15,10 @@ if TYPE_CHECKING:
     from raceresult.client import RaceResultClient
 
 
+# Built once so preview responses are validated straight from the body bytes.
+_PREVIEWS_ADAPTER = TypeAdapter(Optional[list[Preview]])
+
+
 class EmailTemplatesEndpoint:
     """Email templates API endpoint.
 
@@ -59,8 +65,8 @@ class EmailTemplatesEndpoint:
             Email template
         """
         params = {"name": name}
-        result = await self._client.get_json(self._event_id, "emailtemplates/get", params)
-        return EmailTemplate.model_validate(result)
+        content = await self._client.get(self._event_id, "emailtemplates/get", params)
+        return EmailTemplate.model_validate_json(content)
 
     async def save(self, template: EmailTemplate) -> None:
         """Save an email template.
@@ -139,8 +145,8 @@ class EmailTemplatesEndpoint:
             "filter": filter_expr,
             "lang": lang,
         }
-        result = await self._client.get_json(self._event_id, "emailtemplates/preview", params)
-        return [Preview.model_validate(item) for item in (result or [])]
+        content = await self._client.get(self._event_id, "emailtemplates/preview", params)
+        return _PREVIEWS_ADAPTER.validate_json(content) or []
 
     async def send_preview(self, name: str, lang: str, preview: Preview) -> None:
         """Send a preview email.
@@ -5,7 +5,9 @@ Based on go-webapi/eventapi_participants.go.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Optional
+
+from pydantic import TypeAdapter
 
 from raceresult.models.participant import (
     ImportResult,
@@ -18,9 +20,15 @@ if TYPE_CHECKING:
     from raceresult.client import RaceResultClient
 
 
+# Built once so part/entryfee responses are validated straight from the body bytes.
+_ENTRY_FEE_ADAPTER = TypeAdapter(Optional[list[EntryFeeItem]])
+
+
 class Identifier:
     """Participant identifier for API calls."""
 
+    __slots__ = ("name", "value")
+
     def __init__(self, name: str, value: Any):
         self.name = name
         self.value = value
@@ -233,8 +241,8 @@ class ParticipantsEndpoint:
             "firstfree": firstfree,
             "v2": True,
         }
-        result = await self._client.get_json(self._event_id, "part/new", params)
-        return ParticipantNewResponse.model_validate(result)
+        content = await self._client.get(self._event_id, "part/new", params)
+        return ParticipantNewResponse.model_validate_json(content)
 
     async def entry_fee(self, bibs: list[int]) -> list[EntryFeeItem]:
         """Get entry fees for participants.
@@ -248,8 +256,8 @@ class ParticipantsEndpoint:
             List of entry fee items
         """
         params = {"bibs": ",".join(str(b) for b in bibs)}
-        result = await self._client.get_json(self._event_id, "part/entryfee", params)
-        return [EntryFeeItem.model_validate(item) for item in (result or [])]
+        content = await self._client.get(self._event_id, "part/entryfee", params)
+        return _ENTRY_FEE_ADAPTER.validate_json(content) or []
 
     async def create_blanks(
         self,
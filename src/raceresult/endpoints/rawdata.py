@@ -7,9 +7,9 @@ from __future__ import annotations
 
 import json
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
 
 from raceresult.models.timing import RawData
 from raceresult.models.types import RRDecimal
@@ -61,6 +61,10 @@ class RawDataWithAdditionalFields(RawData):
     model_config = {"populate_by_name": True}
 
 
+# Built once so rawdata/get responses are validated straight from the body bytes.
+_RAW_DATA_WITH_FIELDS_ADAPTER = TypeAdapter(Optional[list[RawDataWithAdditionalFields]])
+
+
 class RawDataDistinctValues(BaseModel):
     """Distinct values in raw data.
 
@@ -237,10 +241,8 @@ class RawDataEndpoint:
             params["rdFilter"] = json.dumps(rd_filter_json)
         if add_fields:
             params["addFields"] = add_fields
-        result = await self._client.get_json(self._event_id, "rawdata/get", params)
-        if not result:
-            return []
-        return [RawDataWithAdditionalFields.model_validate(item) for item in result]
+        content = await self._client.get(self._event_id, "rawdata/get", params)
+        return _RAW_DATA_WITH_FIELDS_ADAPTER.validate_json(content) or []
 
     async def export(
         self,
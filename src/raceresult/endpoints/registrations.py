@@ -59,8 +59,8 @@ class RegistrationsEndpoint:
             Registration form definition
         """
         params = {"name": name}
-        result = await self._client.get_json(self._event_id, "registrations/get", params)
-        return Registration.model_validate(result)
+        content = await self._client.get(self._event_id, "registrations/get", params)
+        return Registration.model_validate_json(content)
 
     async def save(self, registration: Registration) -> None:
         """Save a registration form.
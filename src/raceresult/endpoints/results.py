@@ -5,7 +5,9 @@ Based on go-webapi/eventapi_results.go.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
+
+from pydantic import TypeAdapter
 
 from raceresult.models.event import Result
 
@@ -13,6 +15,10 @@ if TYPE_CHECKING:
     from raceresult.client import RaceResultClient
 
 
+# Built once so results/get responses are validated straight from the body bytes.
+_RESULTS_ADAPTER = TypeAdapter(Optional[list[Result]])
+
+
 class ResultsEndpoint:
     """Results API endpoint.
 
@@ -58,10 +64,8 @@ class ResultsEndpoint:
             "onlyFormulas": only_formulas,
             "onlyNoFormulas": only_no_formulas,
         }
-        result = await self._client.get_json(self._event_id, "results/get", params)
-        if not result:
-            return []
-        return [Result.model_validate(item) for item in result]
+        content = await self._client.get(self._event_id, "results/get", params)
+        return _RESULTS_ADAPTER.validate_json(content) or []
 
     async def get_one(self, id: int) -> Result:
         """Get a single result by ID.
@@ -75,8 +79,8 @@ class ResultsEndpoint:
             Result object
         """
         params = {"id": id}
-        result = await self._client.get_json(self._event_id, "results/get", params)
-        return Result.model_validate(result)
+        content = await self._client.get(self._event_id, "results/get", params)
+        return Result.model_validate_json(content)
 
     async def delete(self, id: int) -> None:
         """Delete a result.
@@ -97,5 +101,7 @@ class ResultsEndpoint:
         Args:
             items: Results to save
         """
+        if not items:
+            return
         data = [item.model_dump(by_alias=True) for item in items]
         await self._client.post_json(self._event_id, "results/save", data=data)
@@ -94,6 +94,8 @@ class SettingsEndpoint:
         Args:
             settings: List of settings to save
         """
+        if not settings:
+            return
         data = [s.model_dump(by_alias=True) for s in settings]
         await self._client.post_json(self._event_id, "settings/savesettings", data=data)
 
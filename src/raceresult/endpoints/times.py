@@ -6,51 +6,49 @@ Based on go-webapi/eventapi_times.go.
 from __future__ import annotations
 
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Optional
 
-from raceresult.models.timing import Time, Passing
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
+
+from raceresult.models.timing import Time, Passing, encode_passings_json
+from raceresult.models.types import RRDecimal
 from raceresult.endpoints.participants import Identifier
 
 if TYPE_CHECKING:
     from raceresult.client import RaceResultClient
 
 
-class TimesAddResponseItem:
+class TimesAddResponseItem(BaseModel):
     """Response item from times/add.
 
     Based on go-model/model.go:590-598.
     """
 
-    def __init__(
-        self,
-        status: int = 0,
-        time: Decimal = Decimal(0),
-        result_id: int = 0,
-        result_name: str = "",
-        raw_data_id: int = 0,
-        timing_point: str = "",
-        fields: dict[str, Any] | None = None,
-    ):
-        self.status = status
-        self.time = time
-        self.result_id = result_id
-        self.result_name = result_name
-        self.raw_data_id = raw_data_id
-        self.timing_point = timing_point
-        self.fields = fields or {}
+    status: int = Field(default=0, alias="Status")
+    time: RRDecimal = Field(default=Decimal(0), alias="Time")
+    result_id: int = Field(default=0, alias="ResultID")
+    result_name: str = Field(default="", alias="ResultName")
+    raw_data_id: int = Field(default=0, alias="RawDataID")
+    timing_point: str = Field(default="", alias="TimingPoint")
+    fields: dict[str, Any] = Field(default_factory=dict, alias="Fields")
+
+    model_config = {"populate_by_name": True}
+
+    @field_validator("fields", mode="before")
+    @classmethod
+    def none_to_empty_dict(cls, v: object) -> object:
+        """Convert None to empty dict."""
+        return v if v is not None else {}
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> TimesAddResponseItem:
         """Create from dictionary."""
-        return cls(
-            status=data.get("Status", 0),
-            time=Decimal(str(data.get("Time", 0))),
-            result_id=data.get("ResultID", 0),
-            result_name=data.get("ResultName", ""),
-            raw_data_id=data.get("RawDataID", 0),
-            timing_point=data.get("TimingPoint", ""),
-            fields=data.get("Fields", {}),
-        )
+        return cls.model_validate(data)
+
+
+# Built once so responses are validated in a single core call.
+_ADD_RESPONSE_ADAPTER = TypeAdapter(list[TimesAddResponseItem])
+_TIMES_ADAPTER = TypeAdapter(Optional[list[Time]])
 
 
 class TimesEndpoint:
@@ -274,10 +272,8 @@ class TimesEndpoint:
             identifier.name: identifier.value,
             "result": result,
         }
-        data = await self._client.get_json(self._event_id, "times/get", params)
-        if not data:
-            return []
-        return [Time.model_validate(item) for item in data]
+        content = await self._client.get(self._event_id, "times/get", params)
+        return _TIMES_ADAPTER.validate_json(content) or []
 
     async def count(
         self,
@@ -328,14 +324,16 @@ class TimesEndpoint:
         Returns:
             List of response items
         """
+        if not passings:
+            return []
         params = {
             "contestFilter": contest_filter,
             "ignoreBibToBibAssign": ignore_bib_to_bib_assign,
         }
         if return_fields:
             params["returnFields"] = return_fields
-        data = [p.model_dump(by_alias=True) for p in passings]
+        data = encode_passings_json(passings)
         result = await self._client.post_json(self._event_id, "times/add", params, data)
         if not result:
             return []
-        return [TimesAddResponseItem.from_dict(item) for item in result]
+        return _ADD_RESPONSE_ADAPTER.validate_python(result)
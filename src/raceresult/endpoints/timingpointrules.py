@@ -5,7 +5,9 @@ Based on go-webapi/eventapi_timingpointrules.go.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
+
+from pydantic import TypeAdapter
 
 from raceresult.models.timing import TimingPointRule
 
@@ -13,6 +15,10 @@ if TYPE_CHECKING:
     from raceresult.client import RaceResultClient
 
 
+# Built once so timingpointrules/get responses are validated straight from the body bytes.
+_TIMING_POINT_RULES_ADAPTER = TypeAdapter(Optional[list[TimingPointRule]])
+
+
 class TimingPointRulesEndpoint:
     """Timing Point Rules API endpoint.
 
@@ -43,10 +49,8 @@ class TimingPointRulesEndpoint:
         Returns:
             List of all timing point rules
         """
-        result = await self._client.get_json(self._event_id, "timingpointrules/get")
-        if not result:
-            return []
-        return [TimingPointRule.model_validate(item) for item in result]
+        content = await self._client.get(self._event_id, "timingpointrules/get")
+        return _TIMING_POINT_RULES_ADAPTER.validate_json(content) or []
 
     async def get_one(self, id: int) -> TimingPointRule:
         """Get a single timing point rule by ID.
@@ -60,8 +64,8 @@ class TimingPointRulesEndpoint:
             TimingPointRule object
         """
         params = {"id": id}
-        result = await self._client.get_json(self._event_id, "timingpointrules/get", params)
-        return TimingPointRule.model_validate(result)
+        content = await self._client.get(self._event_id, "timingpointrules/get", params)
+        return TimingPointRule.model_validate_json(content)
 
     async def delete(self, id: int) -> None:
         """Delete a timing point rule.
@@ -85,6 +89,8 @@ class TimingPointRulesEndpoint:
         Returns:
             List of saved timing point rule IDs
         """
+        if not items:
+            return []
         data = [item.model_dump(by_alias=True) for item in items]
         result = await self._client.post_json(
             self._event_id, "timingpointrules/save", data=data
@@ -5,7 +5,9 @@ Based on go-webapi/eventapi_timingpoints.go.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
+
+from pydantic import TypeAdapter
 
 from raceresult.models.timing import TimingPoint
 
@@ -13,6 +15,10 @@ if TYPE_CHECKING:
     from raceresult.client import RaceResultClient
 
 
+# Built once so timingpoints/get responses are validated straight from the body bytes.
+_TIMING_POINTS_ADAPTER = TypeAdapter(Optional[list[TimingPoint]])
+
+
 class TimingPointsEndpoint:
     """Timing Points API endpoint.
 
@@ -43,10 +49,8 @@ class TimingPointsEndpoint:
         Returns:
             List of all timing points
         """
-        result = await self._client.get_json(self._event_id, "timingpoints/get")
-        if not result:
-            return []
-        return [TimingPoint.model_validate(item) for item in result]
+        content = await self._client.get(self._event_id, "timingpoints/get")
+        return _TIMING_POINTS_ADAPTER.validate_json(content) or []
 
     async def get_one(self, name: str) -> TimingPoint:
         """Get a single timing point by name.
@@ -60,8 +64,8 @@ class TimingPointsEndpoint:
             TimingPoint object
         """
         params = {"name": name}
-        result = await self._client.get_json(self._event_id, "timingpoints/get", params)
-        return TimingPoint.model_validate(result)
+        content = await self._client.get(self._event_id, "timingpoints/get", params)
+        return TimingPoint.model_validate_json(content)
 
     async def delete(self, name: str) -> None:
         """Delete a timing point.
@@ -58,6 +58,8 @@ class VouchersEndpoint:
         Args:
             ids: Voucher IDs to delete
         """
+        if not ids:
+            return
         data = ";".join(str(id) for id in ids)
         await self._client.post(
             self._event_id,
@@ -34,6 +34,8 @@ from raceresult.models.payment import (
     VoucherType,
     MethodOption,
     PaymentConstants,
+    PaymentMethodType,
+    PayState,
 )
 from raceresult.models.email import EmailTemplate, TemplateType, HTTPHeader, Preview
 from raceresult.models.timing import (
@@ -45,6 +47,9 @@ from raceresult.models.timing import (
     Time,
     Passing,
     PassingToProcess,
+    decode_passings_json,
+    decode_raw_data_json,
+    encode_passings_json,
 )
 from raceresult.models.public import UserInfo, UserRight, OAuthToken
 
@@ -86,6 +91,8 @@ __all__ = [
     "VoucherType",
     "MethodOption",
     "PaymentConstants",
+    "PaymentMethodType",
+    "PayState",
     # Email
     "EmailTemplate",
     "TemplateType",
@@ -100,6 +107,9 @@ __all__ = [
     "Time",
     "Passing",
     "PassingToProcess",
+    "decode_passings_json",
+    "decode_raw_data_json",
+    "encode_passings_json",
     # Public
     "UserInfo",
     "UserRight",
@@ -203,6 +203,14 @@ class Ranking(BaseModel):
 
     model_config = {"populate_by_name": True}
 
+    def sort_spec(self) -> list[tuple[str, bool]]:
+        """Get the sort expressions paired with their descending flags.
+
+        Missing flags are treated as ascending.
+        """
+        desc = self.sort_desc
+        return [(expr, i < len(desc) and desc[i]) for i, expr in enumerate(self.sort)]
+
 
 class Result(BaseModel):
     """Result definition.
@@ -76,25 +76,28 @@ class Participant(BaseModel):
     @property
     def full_name(self) -> str:
         """Get the full name of the participant."""
-        parts = []
-        if self.firstname:
-            parts.append(self.firstname)
-        if self.lastname:
-            parts.append(self.lastname)
-        return " ".join(parts)
+        firstname, lastname = self.firstname, self.lastname
+        if firstname and lastname:
+            return f"{firstname} {lastname}"
+        return firstname or lastname
 
     @property
     def full_address(self) -> str:
         """Get the full address of the participant."""
-        parts = []
-        if self.street:
-            parts.append(self.street)
-        if self.zip or self.city:
-            city_part = " ".join(filter(None, [self.zip, self.city]))
-            parts.append(city_part)
-        if self.country:
-            parts.append(self.country)
-        return ", ".join(parts)
+        zip_code, city = self.zip, self.city
+        city_part = f"{zip_code} {city}" if zip_code and city else zip_code or city
+        return ", ".join(part for part in (self.street, city_part, self.country) if part)
+
+    def get_boolean(self, index: int) -> bool:
+        """Check a flag of the packed ``booleans`` bit field.
+
+        Args:
+            index: Bit index (0 = least significant bit)
+
+        Returns:
+            True if the bit is set
+        """
+        return self.booleans & (1 << index) != 0
 
 
 class ParticipantNewResponse(BaseModel):
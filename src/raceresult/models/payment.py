@@ -5,6 +5,7 @@ Based on go-model/pay/model.go and go-model/model.go.
 
 from __future__ import annotations
 
+from datetime import datetime, timezone
 from decimal import Decimal
 from enum import IntEnum
 
@@ -25,10 +26,68 @@ class VoucherType(IntEnum):
     PREV_REG = 3
 
 
+class PaymentMethodType(IntEnum):
+    """Payment method.
+
+    Based on go-model/pay/model.go:11-45.
+    """
+
+    NO_PAYMENT = 0
+    CC_EUR = 2
+    CC_CHF = 3
+    UEB_D = 4
+    BAR = 5
+    SPF = 6
+    PPAL_EUR = 7
+    UEB_CH = 8
+    EINZ_CH = 10
+    UEB_SOF = 12
+    PPAL_GBP = 14
+    PPAL_USD = 15
+    SEPA = 16
+    CC_GBP = 17
+    SEPA_DATA = 19
+    OWN_EPAY = 20
+    OWN_PPAL = 21
+    OWN_WIRE_T = 22
+    OWN_PAYTRAIL = 25
+    OWN_ONE_PAY = 26
+    TELR = 27
+    OWN_ONE_PAY_DOM = 28
+    FATORA = 29
+    TWINT = 30
+    STRIPE_CARD = 31
+    OWN_PAYTRAIL_V2 = 32
+    TELR_SALE = 33
+    RED_SYS = 34
+    MOLLIE_BANCONTACT = 35
+    PAY_TABS = 36
+    ASIA_PAY = 37
+    MERCADO_PAGO = 38
+    CB = 99
+
+
+class PayState(IntEnum):
+    """Payment state.
+
+    Based on go-model/pay/model.go:47-54.
+    """
+
+    UNDEFINED = 0
+    PENDING = 1
+    UNDERPAID = 2
+    PAID = 3
+    OVERPAID = 4
+    NO_PAYOUT = 5
+
+
 class PaymentConstants:
     """Payment method constants.
 
     Based on go-model/pay/model.go:11-45.
+
+    Kept as plain ints for backwards compatibility; the same values are
+    available as PaymentMethodType and PayState members.
     """
 
     # Payment methods
@@ -97,11 +156,15 @@ class Voucher(BaseModel):
 
     model_config = {"populate_by_name": True}
 
-    def is_valid(self) -> bool:
-        """Check if voucher is currently valid based on date range and usage."""
-        from datetime import datetime, timezone
+    def is_valid(self, now: datetime | None = None) -> bool:
+        """Check if voucher is currently valid based on date range and usage.
 
-        now = datetime.now(timezone.utc)
+        Args:
+            now: Reference time (default: current UTC time); pass one value
+                when checking many vouchers at once
+        """
+        if now is None:
+            now = datetime.now(timezone.utc)
 
         if self.valid_from and now < self.valid_from:
             return False
@@ -47,19 +47,16 @@ class UserRight(BaseModel):
         Returns:
             True if user has the right
         """
-        if not self.rights:
+        rights = self.rights
+        if not rights:
             return False
-        if "*" in self.rights:
+        if "*" in rights:
             return True
-
-        parts = right.split(".", 1)
-        if parts[0] not in self.rights:
+        area, sep, permission = right.partition(".")
+        permissions = rights.get(area)
+        if permissions is None:
             return False
-        if len(parts) == 1:
-            return True
-
-        permissions = self.rights[parts[0]]
-        return "*" in permissions or parts[1] in permissions
+        return not sep or "*" in permissions or permission in permissions
 
 
 class OAuthToken(BaseModel):
@@ -5,9 +5,10 @@ Based on go-model/registration/registration.go.
 
 from __future__ import annotations
 
+from datetime import datetime, timezone
 from typing import Any, Annotated, TypeVar
 
-from pydantic import BaseModel, Field as PydanticField, BeforeValidator, model_validator
+from pydantic import BaseModel, Field as PydanticField, BeforeValidator
 
 from raceresult.models.types import RRDateTime
 
@@ -23,26 +24,15 @@ def _null_to_list(v: Any) -> list:
 
 
 # Helper type for list fields that may come as null from API
-NullableList = Annotated[list, BeforeValidator(_null_to_list)]
+NullableList = Annotated[list[T], BeforeValidator(_null_to_list)]
 
 
 class NullSafeModel(BaseModel):
-    """Base model that converts null values to empty lists for list fields."""
-
-    @model_validator(mode="before")
-    @classmethod
-    def _convert_null_lists(cls, data: Any) -> Any:
-        if isinstance(data, dict):
-            # Get all list field names from model annotations
-            for field_name, field_info in cls.model_fields.items():
-                # Check if field type is a list (simplified check)
-                alias = field_info.alias or field_name
-                if alias in data and data[alias] is None:
-                    # Check if it's expected to be a list by looking at annotation
-                    annotation = cls.__annotations__.get(field_name, None)
-                    if annotation and "list" in str(annotation).lower():
-                        data[alias] = []
-        return data
+    """Base model for registration models.
+
+    List fields are declared as ``NullableList`` so that null values sent by
+    the API become empty lists.
+    """
 
     model_config = {"populate_by_name": True}
 
@@ -56,8 +46,6 @@ class Style(NullSafeModel):
     attribute: str = PydanticField(default="", alias="Attribute")
     value: str = PydanticField(default="", alias="Value")
 
-    model_config = {"populate_by_name": True}
-
 
 class Value(NullSafeModel):
     """Dropdown value option.
@@ -73,8 +61,6 @@ class Value(NullSafeModel):
     max_capacity: int = PydanticField(default=0, alias="MaxCapacity")
     show_if: str = PydanticField(default="", alias="ShowIf")
 
-    model_config = {"populate_by_name": True}
-
 
 class ValidationRule(NullSafeModel):
     """Validation rule for form fields.
@@ -85,8 +71,6 @@ class ValidationRule(NullSafeModel):
     rule: str = PydanticField(default="", alias="Rule")
     msg: str = PydanticField(default="", alias="Msg")
 
-    model_config = {"populate_by_name": True}
-
 
 class FormField(NullSafeModel):
     """Form field definition.
@@ -104,11 +88,11 @@ class FormField(NullSafeModel):
     special: str = PydanticField(default="", alias="Special")
     special_details: str = PydanticField(default="", alias="SpecialDetails")
     force_update: bool = PydanticField(default=False, alias="ForceUpdate")
-    values: list[Value] = PydanticField(default_factory=list, alias="Values")
-    additional_options: list[str] = PydanticField(default_factory=list, alias="AdditionalOptions")
-    flags: list[str] = PydanticField(default_factory=list, alias="Flags")
-
-    model_config = {"populate_by_name": True}
+    values: NullableList[Value] = PydanticField(default_factory=list, alias="Values")
+    additional_options: NullableList[str] = PydanticField(
+        default_factory=list, alias="AdditionalOptions"
+    )
+    flags: NullableList[str] = PydanticField(default_factory=list, alias="Flags")
 
 
 class Element(NullSafeModel):
@@ -128,14 +112,14 @@ class Element(NullSafeModel):
     show_if_curr: str = PydanticField(default="", alias="ShowIfCurr")
     show_if_curr_mode: int = PydanticField(default=0, alias="ShowIfCurrMode")
     show_if_initial: bool = PydanticField(default=False, alias="ShowIfInitial")
-    styles: list[Style] = PydanticField(default_factory=list, alias="Styles")
+    styles: NullableList[Style] = PydanticField(default_factory=list, alias="Styles")
     class_name: str = PydanticField(default="", alias="ClassName")
     id: int = PydanticField(default=0, alias="ID")
     common: int = PydanticField(default=0, alias="Common")
-    validation_rules: list[ValidationRule] = PydanticField(default_factory=list, alias="ValidationRules")
-    children: list[Element] = PydanticField(default_factory=list, alias="Children")
-
-    model_config = {"populate_by_name": True}
+    validation_rules: NullableList[ValidationRule] = PydanticField(
+        default_factory=list, alias="ValidationRules"
+    )
+    children: NullableList[Element] = PydanticField(default_factory=list, alias="Children")
 
 
 class Step(NullSafeModel):
@@ -149,11 +133,9 @@ class Step(NullSafeModel):
     enabled: bool = PydanticField(default=True, alias="Enabled")
     enabled_from: RRDateTime = PydanticField(default=None, alias="EnabledFrom")
     enabled_to: RRDateTime = PydanticField(default=None, alias="EnabledTo")
-    elements: list[Element] = PydanticField(default_factory=list, alias="Elements")
+    elements: NullableList[Element] = PydanticField(default_factory=list, alias="Elements")
     button_text: str = PydanticField(default="", alias="ButtonText")
 
-    model_config = {"populate_by_name": True}
-
 
 class AdditionalValue(NullSafeModel):
     """Additional value computed during registration.
@@ -167,8 +149,6 @@ class AdditionalValue(NullSafeModel):
     filter: str = PydanticField(default="", alias="Filter")
     filter_initial: str = PydanticField(default="", alias="FilterInitial")
 
-    model_config = {"populate_by_name": True}
-
 
 class Confirmation(NullSafeModel):
     """Confirmation page settings.
@@ -179,8 +159,6 @@ class Confirmation(NullSafeModel):
     title: str = PydanticField(default="", alias="Title")
     expression: str = PydanticField(default="", alias="Expression")
 
-    model_config = {"populate_by_name": True}
-
 
 class AfterSave(NullSafeModel):
     """Action to perform after saving registration.
@@ -192,9 +170,7 @@ class AfterSave(NullSafeModel):
     value: str = PydanticField(default="", alias="Value")
     destination: str = PydanticField(default="", alias="Destination")
     filter: str = PydanticField(default="", alias="Filter")
-    flags: list[str] = PydanticField(default_factory=list, alias="Flags")
-
-    model_config = {"populate_by_name": True}
+    flags: NullableList[str] = PydanticField(default_factory=list, alias="Flags")
 
 
 class PaymentMethod(NullSafeModel):
@@ -210,8 +186,6 @@ class PaymentMethod(NullSafeModel):
     enabled_to: RRDateTime = PydanticField(default=None, alias="EnabledTo")
     filter: str = PydanticField(default="", alias="Filter")
 
-    model_config = {"populate_by_name": True}
-
 
 class ErrorMessages(NullSafeModel):
     """Custom error messages for registration.
@@ -222,8 +196,6 @@ class ErrorMessages(NullSafeModel):
     befor_reg_start: str = PydanticField(default="", alias="BeforRegStart")
     after_reg_end: str = PydanticField(default="", alias="AfterRegEnd")
 
-    model_config = {"populate_by_name": True}
-
 
 class Registration(NullSafeModel):
     """Registration form definition.
@@ -248,31 +220,39 @@ class Registration(NullSafeModel):
     limit: int = PydanticField(default=0, alias="Limit")
     change_identity_field: str = PydanticField(default="", alias="ChangeIdentityField")
     change_identity_filter: str = PydanticField(default="", alias="ChangeIdentityFilter")
-    steps: list[Step] = PydanticField(default_factory=list, alias="Steps")
-    additional_values: list[AdditionalValue] = PydanticField(default_factory=list, alias="AdditionalValues")
+    steps: NullableList[Step] = PydanticField(default_factory=list, alias="Steps")
+    additional_values: NullableList[AdditionalValue] = PydanticField(
+        default_factory=list, alias="AdditionalValues"
+    )
     check_sex: bool = PydanticField(default=False, alias="CheckSex")
     check_duplicate: bool = PydanticField(default=False, alias="CheckDuplicate")
     dont_propose_gender: bool = PydanticField(default=False, alias="DontProposeGender")
     online_payment: bool = PydanticField(default=False, alias="OnlinePayment")
     online_payment_button_text: str = PydanticField(default="", alias="OnlinePaymentButtonText")
-    payment_methods: list[PaymentMethod] = PydanticField(default_factory=list, alias="PaymentMethods")
+    payment_methods: NullableList[PaymentMethod] = PydanticField(
+        default_factory=list, alias="PaymentMethods"
+    )
     online_refund: bool = PydanticField(default=False, alias="OnlineRefund")
-    refund_methods: list[PaymentMethod] = PydanticField(default_factory=list, alias="RefundMethods")
+    refund_methods: NullableList[PaymentMethod] = PydanticField(
+        default_factory=list, alias="RefundMethods"
+    )
     confirmation: Confirmation = PydanticField(default_factory=Confirmation, alias="Confirmation")
-    after_save: list[AfterSave] = PydanticField(default_factory=list, alias="AfterSave")
+    after_save: NullableList[AfterSave] = PydanticField(default_factory=list, alias="AfterSave")
     css: str = PydanticField(default="", alias="CSS")
     error_messages: ErrorMessages = PydanticField(default_factory=ErrorMessages, alias="ErrorMessages")
 
-    model_config = {"populate_by_name": True}
+    def is_active(self, now: datetime | None = None) -> bool:
+        """Check if registration is currently active based on enabled and date range.
 
-    def is_active(self) -> bool:
-        """Check if registration is currently active based on enabled and date range."""
+        Args:
+            now: Reference time (default: current UTC time); pass one value
+                when checking many registrations at once
+        """
         if not self.enabled:
             return False
 
-        from datetime import datetime, timezone
-
-        now = datetime.now(timezone.utc)
+        if now is None:
+            now = datetime.now(timezone.utc)
 
         if self.enabled_from and now < self.enabled_from:
             return False
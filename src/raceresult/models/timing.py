@@ -7,7 +7,7 @@ from __future__ import annotations
 
 from decimal import Decimal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 from raceresult.models.types import RRDecimal
 
@@ -156,3 +156,44 @@ class PassingToProcess(BaseModel):
     passing: Passing | None = Field(default=None, alias="Passing")
 
     model_config = {"populate_by_name": True}
+
+
+# Built once so bulk timing data is converted straight from/to JSON bytes.
+_PASSINGS_ADAPTER = TypeAdapter(list[Passing])
+_RAW_DATA_ADAPTER = TypeAdapter(list[RawData])
+
+
+def decode_passings_json(data: bytes | str) -> list[Passing]:
+    """Decode a JSON array of passings, e.g. a decoder export.
+
+    Args:
+        data: JSON array of passing objects
+
+    Returns:
+        List of passings
+    """
+    return _PASSINGS_ADAPTER.validate_json(data)
+
+
+def decode_raw_data_json(data: bytes | str) -> list[RawData]:
+    """Decode a JSON array of raw data entries.
+
+    Args:
+        data: JSON array of raw data objects
+
+    Returns:
+        List of raw data entries
+    """
+    return _RAW_DATA_ADAPTER.validate_json(data)
+
+
+def encode_passings_json(passings: list[Passing]) -> bytes:
+    """Encode passings as a JSON array using the API field names.
+
+    Args:
+        passings: Passings to encode
+
+    Returns:
+        JSON array as bytes
+    """
+    return _PASSINGS_ADAPTER.dump_json(passings, by_alias=True)
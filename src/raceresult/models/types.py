@@ -10,6 +10,7 @@ from __future__ import annotations
 
 from datetime import date, datetime, timezone
 from decimal import Decimal as PyDecimal
+from functools import lru_cache
 from typing import Annotated, Any, Optional
 
 from pydantic import BeforeValidator, PlainSerializer, WithJsonSchema
@@ -22,6 +23,10 @@ DECIMAL_FACTOR = 10000
 VB_ZERO_DATE = date(1899, 12, 30)
 GO_ZERO_DATE = date(1, 1, 1)
 
+# Parsed date/datetime strings kept per parser; payloads repeat the same
+# values (race day, registration windows) across many records.
+_PARSE_CACHE_SIZE = 2048
+
 
 def _parse_rr_date(value: Any) -> date | None:
     """Parse a Raceresult date value."""
@@ -34,22 +39,35 @@ def _parse_rr_date(value: Any) -> date | None:
     if isinstance(value, str):
         if not value:
             return None
-        # ISO format: YYYY-MM-DD
+        return _parse_rr_date_str(value)
+    return None
+
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _parse_rr_date_str(value: str) -> date | None:
+    """Parse a non-empty Raceresult date string."""
+    # European format with zero padding: DD.MM.YYYY
+    if len(value) == 10 and value[2] == "." and value[5] == ".":
         try:
-            parsed = date.fromisoformat(value)
-            if parsed == VB_ZERO_DATE or parsed == GO_ZERO_DATE:
-                return None
-            return parsed
+            return date(int(value[6:10]), int(value[3:5]), int(value[0:2]))
         except ValueError:
-            pass
-        # European format: DD.MM.YYYY
-        if "." in value:
-            parts = value.split(".")
-            if len(parts) == 3:
-                try:
-                    return date(int(parts[2]), int(parts[1]), int(parts[0]))
-                except ValueError:
-                    pass
+            return None
+    # ISO format: YYYY-MM-DD
+    try:
+        parsed = date.fromisoformat(value)
+        if parsed == VB_ZERO_DATE or parsed == GO_ZERO_DATE:
+            return None
+        return parsed
+    except ValueError:
+        pass
+    # European format: DD.MM.YYYY
+    if "." in value:
+        parts = value.split(".")
+        if len(parts) == 3:
+            try:
+                return date(int(parts[2]), int(parts[1]), int(parts[0]))
+            except ValueError:
+                pass
     return None
 
 
@@ -85,48 +103,58 @@ def _parse_rr_datetime(value: Any) -> datetime | None:
     if isinstance(value, str):
         if not value:
             return None
-        # Try RFC3339 (with timezone)
-        if "T" in value:
-            try:
-                return datetime.fromisoformat(value.replace("Z", "+00:00"))
-            except ValueError:
-                pass
-        # Try datetime format: YYYY-MM-DD HH:MM:SS
-        if " " in value and len(value) == 19:
-            try:
-                return datetime.strptime(value, "%Y-%m-%d %H:%M:%S").replace(
-                    tzinfo=timezone.utc
-                )
-            except ValueError:
-                pass
-        # Try date-only format: YYYY-MM-DD
-        if len(value) == 10:
+        return _parse_rr_datetime_str(value)
+    return None
+
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _parse_rr_datetime_str(value: str) -> datetime | None:
+    """Parse a non-empty Raceresult datetime string."""
+    n = len(value)
+    sep = value[10] if n > 10 else ""
+    # Try RFC3339 (with timezone)
+    if sep == "T":
+        try:
+            return datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            pass
+    # Try datetime format: YYYY-MM-DD HH:MM:SS
+    if n == 19 and sep == " " and value[4] == value[7] == "-" and value[13] == value[16] == ":":
+        try:
+            parsed = datetime.fromisoformat(value)
+        except ValueError:
+            pass
+        else:
+            if parsed.tzinfo is None:
+                return parsed.replace(tzinfo=timezone.utc)
+    # Try date-only format: YYYY-MM-DD
+    elif n == 10 and value[4] == "-":
+        try:
+            d = date.fromisoformat(value)
+            return datetime(d.year, d.month, d.day, tzinfo=timezone.utc)
+        except ValueError:
+            pass
+    # European datetime: DD.MM.YYYY HH:MM:SS
+    if "." in value:
+        parts = value.split(" ")
+        date_parts = parts[0].split(".")
+        if len(date_parts) == 3:
             try:
-                d = date.fromisoformat(value)
+                d = date(int(date_parts[2]), int(date_parts[1]), int(date_parts[0]))
+                if len(parts) > 1:
+                    time_parts = parts[1].split(":")
+                    return datetime(
+                        d.year,
+                        d.month,
+                        d.day,
+                        int(time_parts[0]),
+                        int(time_parts[1]) if len(time_parts) > 1 else 0,
+                        int(time_parts[2]) if len(time_parts) > 2 else 0,
+                        tzinfo=timezone.utc,
+                    )
                 return datetime(d.year, d.month, d.day, tzinfo=timezone.utc)
-            except ValueError:
+            except (ValueError, IndexError):
                 pass
-        # European datetime: DD.MM.YYYY HH:MM:SS
-        if "." in value:
-            parts = value.split(" ")
-            date_parts = parts[0].split(".")
-            if len(date_parts) == 3:
-                try:
-                    d = date(int(date_parts[2]), int(date_parts[1]), int(date_parts[0]))
-                    if len(parts) > 1:
-                        time_parts = parts[1].split(":")
-                        return datetime(
-                            d.year,
-                            d.month,
-                            d.day,
-                            int(time_parts[0]),
-                            int(time_parts[1]) if len(time_parts) > 1 else 0,
-                            int(time_parts[2]) if len(time_parts) > 2 else 0,
-                            tzinfo=timezone.utc,
-                        )
-                    return datetime(d.year, d.month, d.day, tzinfo=timezone.utc)
-                except (ValueError, IndexError):
-                    pass
     return None
 
 
@@ -173,19 +201,26 @@ def _parse_rr_decimal(value: Any) -> PyDecimal:
     """Parse a Raceresult decimal value."""
     if value is None:
         return PyDecimal(0)
-    if isinstance(value, PyDecimal):
-        return value
-    if isinstance(value, (int, float)):
-        return PyDecimal(str(value))
-    if isinstance(value, str):
+    # Exact type checks first: JSON numbers and strings are by far the common case
+    kind = type(value)
+    if kind is int:
+        return PyDecimal(value)
+    if kind is float:
+        return PyDecimal(repr(value))
+    if kind is str:
         if not value:
             return PyDecimal(0)
         # Handle comma as decimal separator
-        value = value.replace(",", ".")
+        if "," in value:
+            value = value.replace(",", ".")
         try:
             return PyDecimal(value)
         except Exception:
             return PyDecimal(0)
+    if isinstance(value, PyDecimal):
+        return value
+    if isinstance(value, (int, float)):
+        return PyDecimal(str(value))
     return PyDecimal(0)
 
 
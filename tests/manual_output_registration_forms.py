@@ -4,122 +4,157 @@
 import argparse
 import asyncio
 import os
+import sys
 from dotenv import load_dotenv
 
-load_dotenv()
-
 from raceresult import RaceResultAPI
 
+# Output lines are collected here and written in one go per registration
+_out: list[str] = []
+
+_RULE = "=" * 70
+_SUBRULE = "-" * 50
+# Indentation prefixes for the usual nesting depths
+_INDENTS = tuple("  " * i for i in range(24))
+
+
+def _indent(level: int) -> str:
+    """Get the prefix for an indentation level."""
+    return _INDENTS[level] if level < len(_INDENTS) else "  " * level
+
+
+def _w(line: str) -> None:
+    """Queue a line of output."""
+    _out.append(line)
+
+
+def _flush() -> None:
+    """Write all queued lines to stdout."""
+    if _out:
+        _out.append("")
+        sys.stdout.write("\n".join(_out))
+        _out.clear()
+
 
 def print_section(title: str, level: int = 1):
     """Print a section header."""
     if level == 1:
-        print(f"\n{'=' * 70}")
-        print(f" {title}")
-        print(f"{'=' * 70}")
+        _w(f"\n{_RULE}")
+        _w(f" {title}")
+        _w(f"{_RULE}")
     elif level == 2:
-        print(f"\n  {'-' * 50}")
-        print(f"  {title}")
-        print(f"  {'-' * 50}")
+        _w(f"\n  {_SUBRULE}")
+        _w(f"  {title}")
+        _w(f"  {_SUBRULE}")
     else:
-        print(f"\n    {title}")
-        print(f"    {'-' * len(title)}")
+        _w(f"\n    {title}")
+        _w(f"    {'-' * len(title)}")
 
 
 def print_field(name: str, value, indent: int = 2):
     """Print a field with indentation."""
-    prefix = "  " * indent
-    if value is not None and value != "" and value != [] and value != {}:
-        print(f"{prefix}{name}: {value}")
+    # Skip missing and empty values; 0 and False are still printed
+    if value is None or (not value and isinstance(value, (str, list, dict))):
+        return
+    _w(f"{_indent(indent)}{name}: {value}")
 
 
 def print_element(elem, indent: int = 4):
-    """Recursively print an element and its children."""
-    prefix = "  " * indent
+    """Print an element and its children, depth-first in form order."""
+    stack = [(elem, indent)]
+    while stack:
+        elem, indent = stack.pop()
+        _print_element_details(elem, indent)
+        if elem.children:
+            stack.extend((child, indent + 2) for child in reversed(elem.children))
+
+
+def _print_element_details(elem, indent: int):
+    """Print a single element without descending into its children."""
+    prefix = _indent(indent)
 
     # Element header
     elem_type = elem.type or "unknown"
     elem_label = f" - {elem.label}" if elem.label else ""
-    print(f"{prefix}[{elem_type}]{elem_label}")
+    _w(f"{prefix}[{elem_type}]{elem_label}")
 
     # Element details
     if elem.id:
-        print(f"{prefix}  ID: {elem.id}")
+        _w(f"{prefix}  ID: {elem.id}")
     if not elem.enabled:
-        print(f"{prefix}  Enabled: False")
+        _w(f"{prefix}  Enabled: False")
     if elem.enabled_from:
-        print(f"{prefix}  Enabled From: {elem.enabled_from}")
+        _w(f"{prefix}  Enabled From: {elem.enabled_from}")
     if elem.enabled_to:
-        print(f"{prefix}  Enabled To: {elem.enabled_to}")
+        _w(f"{prefix}  Enabled To: {elem.enabled_to}")
     if elem.show_if:
-        print(f"{prefix}  ShowIf: {elem.show_if}")
+        _w(f"{prefix}  ShowIf: {elem.show_if}")
     if elem.show_if_curr:
-        print(f"{prefix}  ShowIfCurr: {elem.show_if_curr}")
+        _w(f"{prefix}  ShowIfCurr: {elem.show_if_curr}")
     if elem.class_name:
-        print(f"{prefix}  ClassName: {elem.class_name}")
+        _w(f"{prefix}  ClassName: {elem.class_name}")
     if elem.common:
-        print(f"{prefix}  Common: {elem.common}")
+        _w(f"{prefix}  Common: {elem.common}")
 
     # Styles
     if elem.styles:
         styles_str = ", ".join(f"{s.attribute}={s.value}" for s in elem.styles)
-        print(f"{prefix}  Styles: {styles_str}")
+        _w(f"{prefix}  Styles: {styles_str}")
 
     # Field (singular)
     if elem.field:
         f = elem.field
-        print(f"{prefix}  Field: {f.name}")
+        _w(f"{prefix}  Field: {f.name}")
         if f.control_type:
-            print(f"{prefix}    ControlType: {f.control_type}")
+            _w(f"{prefix}    ControlType: {f.control_type}")
         if f.mandatory:
-            print(f"{prefix}    Mandatory: {f.mandatory}")
+            _w(f"{prefix}    Mandatory: {f.mandatory}")
         if f.default_value:
-            print(f"{prefix}    Default: {f.default_value}")
+            _w(f"{prefix}    Default: {f.default_value}")
         if f.placeholder:
-            print(f"{prefix}    Placeholder: {f.placeholder}")
+            _w(f"{prefix}    Placeholder: {f.placeholder}")
         if f.unique:
-            print(f"{prefix}    Unique: {f.unique}")
+            _w(f"{prefix}    Unique: {f.unique}")
         if f.special:
-            print(f"{prefix}    Special: {f.special}")
+            _w(f"{prefix}    Special: {f.special}")
         if f.special_details:
-            print(f"{prefix}    SpecialDetails: {f.special_details}")
+            _w(f"{prefix}    SpecialDetails: {f.special_details}")
         if f.force_update:
-            print(f"{prefix}    ForceUpdate: True")
+            _w(f"{prefix}    ForceUpdate: True")
         if f.flags:
-            print(f"{prefix}    Flags: {f.flags}")
+            _w(f"{prefix}    Flags: {f.flags}")
         if f.additional_options:
-            print(f"{prefix}    AdditionalOptions: {f.additional_options}")
+            _w(f"{prefix}    AdditionalOptions: {f.additional_options}")
 
         # Field values (dropdown options)
         if f.values:
-            print(f"{prefix}    Values ({len(f.values)}):")
+            _w(f"{prefix}    Values ({len(f.values)}):")
             for v in f.values[:10]:  # Limit to first 10
-                v_str = f"{prefix}      - {v.value}"
-                if v.label and v.label != str(v.value):
-                    v_str += f" ({v.label})"
+                value_str = str(v.value)
+                parts = [f"{prefix}      - {value_str}"]
+                if v.label and v.label != value_str:
+                    parts.append(f" ({v.label})")
                 if not v.enabled:
-                    v_str += " [disabled]"
+                    parts.append(" [disabled]")
                 if v.max_capacity:
-                    v_str += f" [max: {v.max_capacity}]"
+                    parts.append(f" [max: {v.max_capacity}]")
                 if v.show_if:
-                    v_str += f" [showIf: {v.show_if}]"
-                print(v_str)
+                    parts.append(f" [showIf: {v.show_if}]")
+                _w("".join(parts))
             if len(f.values) > 10:
-                print(f"{prefix}      ... and {len(f.values) - 10} more")
+                _w(f"{prefix}      ... and {len(f.values) - 10} more")
 
     # Validation rules
     if elem.validation_rules:
-        print(f"{prefix}  ValidationRules:")
+        _w(f"{prefix}  ValidationRules:")
         for vr in elem.validation_rules:
-            print(f"{prefix}    - Rule: {vr.rule}")
+            _w(f"{prefix}    - Rule: {vr.rule}")
             if vr.msg:
-                print(f"{prefix}      Msg: {vr.msg}")
+                _w(f"{prefix}      Msg: {vr.msg}")
 
-    # Children (recursive)
+    # Children are printed by print_element
     if elem.children:
-        print(f"{prefix}  Children ({len(elem.children)}):")
-        for child in elem.children:
-            print_element(child, indent + 2)
+        _w(f"{prefix}  Children ({len(elem.children)}):")
 
 
 async def main():
@@ -132,11 +167,13 @@ async def main():
     parser.add_argument("--compact", "-c", action="store_true", help="Compact output (less details)")
     args = parser.parse_args()
 
+    load_dotenv()
     api_key = args.api_key or os.getenv("API_KEY", "").strip('"')
     event_id = args.event_id
 
     if not api_key:
-        print("Error: API key required. Set API_KEY env var or use --api-key")
+        _w("Error: API key required. Set API_KEY env var or use --api-key")
+        _flush()
         return
 
     async with RaceResultAPI() as api:
@@ -147,8 +184,8 @@ async def main():
         settings = await event.settings.get("EventName")
         event_name = settings.get("EventName", event_id)
 
-        print(f"\nRegistration Forms for: {event_name}")
-        print(f"Event ID: {event_id}")
+        _w(f"\nRegistration Forms for: {event_name}")
+        _w(f"Event ID: {event_id}")
 
         # Get registration names
         reg_names = await event.registrations.names()
@@ -157,15 +194,18 @@ async def main():
             if args.name in reg_names:
                 reg_names = [args.name]
             else:
-                print(f"\nError: Registration '{args.name}' not found.")
-                print(f"Available: {reg_names}")
+                _w(f"\nError: Registration '{args.name}' not found.")
+                _w(f"Available: {reg_names}")
+                _flush()
                 return
 
-        print(f"Found {len(reg_names)} registration form(s): {reg_names}")
+        _w(f"Found {len(reg_names)} registration form(s): {reg_names}")
+        _flush()
 
-        for reg_name in reg_names:
-            reg = await event.registrations.get(reg_name)
+        # Fetch all forms concurrently, then print them in order
+        regs = await asyncio.gather(*(event.registrations.get(name) for name in reg_names))
 
+        for reg in regs:
             print_section(f"REGISTRATION: {reg.name}")
 
             # Basic settings
@@ -206,7 +246,7 @@ async def main():
             if reg.css:
                 print_section("Custom CSS", 2)
                 css_preview = reg.css[:200] + "..." if len(reg.css) > 200 else reg.css
-                print(f"    {css_preview}")
+                _w(f"    {css_preview}")
 
             # Steps
             if reg.steps:
@@ -221,13 +261,13 @@ async def main():
                     print_field("Button Text", step.button_text, 4)
 
                     if step.elements:
-                        print(f"        Elements ({len(step.elements)}):")
+                        _w(f"        Elements ({len(step.elements)}):")
                         if args.compact:
                             for elem in step.elements:
                                 elem_type = elem.type or "unknown"
                                 elem_label = elem.label or ""
                                 field_name = elem.field.name if elem.field else ""
-                                print(f"          - [{elem_type}] {elem_label} {field_name}".strip())
+                                _w(f"          - [{elem_type}] {elem_label} {field_name}".strip())
                         else:
                             for elem in step.elements:
                                 print_element(elem, indent=5)
@@ -236,7 +276,7 @@ async def main():
             if reg.additional_values:
                 print_section(f"Additional Values ({len(reg.additional_values)})", 2)
                 for av in reg.additional_values:
-                    print(f"    - {av.field_name}")
+                    _w(f"    - {av.field_name}")
                     print_field("Source", av.source, 3)
                     print_field("Value", av.value, 3)
                     print_field("Filter", av.filter, 3)
@@ -255,13 +295,13 @@ async def main():
                     pm_info = f"    - ID {pm.id}: {pm.label}"
                     if not pm.enabled:
                         pm_info += " [disabled]"
-                    print(pm_info)
+                    _w(pm_info)
                     if pm.filter:
-                        print(f"        Filter: {pm.filter}")
+                        _w(f"        Filter: {pm.filter}")
                     if pm.enabled_from:
-                        print(f"        Enabled From: {pm.enabled_from}")
+                        _w(f"        Enabled From: {pm.enabled_from}")
                     if pm.enabled_to:
-                        print(f"        Enabled To: {pm.enabled_to}")
+                        _w(f"        Enabled To: {pm.enabled_to}")
 
             # Refund Methods
             if reg.refund_methods:
@@ -270,7 +310,7 @@ async def main():
                     rm_info = f"    - ID {rm.id}: {rm.label}"
                     if not rm.enabled:
                         rm_info += " [disabled]"
-                    print(rm_info)
+                    _w(rm_info)
 
             # Confirmation
             if reg.confirmation and (reg.confirmation.title or reg.confirmation.expression):
@@ -282,7 +322,7 @@ async def main():
             if reg.after_save:
                 print_section(f"After Save Actions ({len(reg.after_save)})", 2)
                 for action in reg.after_save:
-                    print(f"    - Type: {action.type}")
+                    _w(f"    - Type: {action.type}")
                     print_field("Value", action.value, 3)
                     print_field("Destination", action.destination, 3)
                     print_field("Filter", action.filter, 3)
@@ -296,9 +336,12 @@ async def main():
                     print_field("Before Reg Start", em.befor_reg_start, 3)
                     print_field("After Reg End", em.after_reg_end, 3)
 
-        print(f"\n{'=' * 70}")
-        print(f" COMPLETE - {len(reg_names)} registration form(s) displayed")
-        print(f"{'=' * 70}\n")
+            _flush()
+
+        _w(f"\n{_RULE}")
+        _w(f" COMPLETE - {len(reg_names)} registration form(s) displayed")
+        _w(f"{_RULE}\n")
+        _flush()
 
 
 if __name__ == "__main__":
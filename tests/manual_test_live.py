@@ -6,11 +6,23 @@ import asyncio
 import os
 from dotenv import load_dotenv
 
-load_dotenv()
-
 from raceresult import RaceResultAPI
 from raceresult.endpoints.participants import Identifier
 
+# Maximum number of endpoint checks in flight at once
+MAX_CONCURRENT = 10
+
+
+async def run_check(sem: asyncio.Semaphore, title: str, failure: str, check) -> list[str]:
+    """Run one endpoint check and collect its output lines."""
+    lines = [f"\n{title}"]
+    async with sem:
+        try:
+            lines.extend(await check())
+        except Exception as e:
+            lines.append(f"   ✗ {failure} failed: {e}")
+    return lines
+
 
 async def main():
     parser = argparse.ArgumentParser(description="Live test against a Raceresult event")
@@ -18,6 +30,7 @@ async def main():
     parser.add_argument("--api-key", help="API key (or set API_KEY env var)")
     args = parser.parse_args()
 
+    load_dotenv()
     api_key = args.api_key or os.getenv("API_KEY", "").strip('"')
     event_id = args.event_id
 
@@ -38,252 +51,226 @@ async def main():
             print(f"   ✗ Login failed: {e}")
             return
 
-        # User info
-        print("\n2. USER INFO")
-        try:
+        event = api.event(event_id)
+
+        async def user_info():
             user_info = await api.user_info()
-            print(f"   CustNo: {user_info.cust_no}")
-            print(f"   UserName: {user_info.user_name}")
-        except Exception as e:
-            print(f"   ✗ User info failed: {e}")
+            return [
+                f"   CustNo: {user_info.cust_no}",
+                f"   UserName: {user_info.user_name}",
+            ]
 
-        # Event list
-        print("\n3. EVENT LIST")
-        try:
+        async def event_list():
             events = await api.event_list(year=2024)
-            print(f"   Found {len(events)} events in 2024")
-            for ev in events[:3]:
-                print(f"   - {ev.id}: {ev.event_name}")
-        except Exception as e:
-            print(f"   ✗ Event list failed: {e}")
+            lines = [f"   Found {len(events)} events in 2024"]
+            lines.extend(f"   - {ev.id}: {ev.event_name}" for ev in events[:3])
+            return lines
 
-        event = api.event(event_id)
-
-        # Settings
-        print("\n4. SETTINGS")
-        try:
+        async def settings():
             settings = await event.settings.get(
                 "EventName", "EventDate", "EventDate2", "BillingMode"
             )
-            for name, value in settings.items():
-                print(f"   {name}: {value}")
-        except Exception as e:
-            print(f"   ✗ Settings failed: {e}")
+            return [f"   {name}: {value}" for name, value in settings.items()]
 
-        # Contests
-        print("\n5. CONTESTS")
-        try:
+        async def contests():
             contests = await event.contests.get()
-            print(f"   Found {len(contests)} contests")
-            for c in contests[:5]:
-                print(f"   - ID {c.id}: {c.name} ({c.name_short})")
-        except Exception as e:
-            print(f"   ✗ Contests failed: {e}")
+            lines = [f"   Found {len(contests)} contests"]
+            lines.extend(f"   - ID {c.id}: {c.name} ({c.name_short})" for c in contests[:5])
+            return lines
 
-        # Age Groups
-        print("\n6. AGE GROUPS")
-        try:
+        async def agegroups():
             agegroups = await event.agegroups.get()
-            print(f"   Found {len(agegroups)} age groups")
-            for ag in agegroups[:5]:
-                print(f"   - ID {ag.id}: {ag.name} (Contest: {ag.contest}, Set: {ag.ag_set})")
-        except Exception as e:
-            print(f"   ✗ Age groups failed: {e}")
+            lines = [f"   Found {len(agegroups)} age groups"]
+            lines.extend(
+                f"   - ID {ag.id}: {ag.name} (Contest: {ag.contest}, Set: {ag.ag_set})"
+                for ag in agegroups[:5]
+            )
+            return lines
 
-        # Bib Ranges
-        print("\n7. BIB RANGES")
-        try:
+        async def bibranges():
             bibranges = await event.bibranges.get()
-            print(f"   Found {len(bibranges)} bib ranges")
-            for br in bibranges[:5]:
-                print(f"   - ID {br.id}: {br.bib_start}-{br.bib_end} (Contest: {br.contest})")
-        except Exception as e:
-            print(f"   ✗ Bib ranges failed: {e}")
+            lines = [f"   Found {len(bibranges)} bib ranges"]
+            lines.extend(
+                f"   - ID {br.id}: {br.bib_start}-{br.bib_end} (Contest: {br.contest})"
+                for br in bibranges[:5]
+            )
+            return lines
 
-        # Custom Fields
-        print("\n8. CUSTOM FIELDS")
-        try:
+        async def customfields():
             customfields = await event.customfields.get()
-            print(f"   Found {len(customfields)} custom fields")
-            for cf in customfields[:5]:
-                print(f"   - ID {cf.id}: {cf.name} (Type: {cf.field_type.name})")
-        except Exception as e:
-            print(f"   ✗ Custom fields failed: {e}")
+            lines = [f"   Found {len(customfields)} custom fields"]
+            lines.extend(
+                f"   - ID {cf.id}: {cf.name} (Type: {cf.field_type.name})"
+                for cf in customfields[:5]
+            )
+            return lines
 
-        # Entry Fees
-        print("\n9. ENTRY FEES")
-        try:
+        async def entryfees():
             entryfees = await event.entryfees.get()
-            print(f"   Found {len(entryfees)} entry fees")
-            for ef in entryfees[:5]:
-                print(f"   - ID {ef.id}: {ef.name} = {ef.fee} (Contest: {ef.contest})")
-        except Exception as e:
-            print(f"   ✗ Entry fees failed: {e}")
+            lines = [f"   Found {len(entryfees)} entry fees"]
+            lines.extend(
+                f"   - ID {ef.id}: {ef.name} = {ef.fee} (Contest: {ef.contest})"
+                for ef in entryfees[:5]
+            )
+            return lines
 
-        # Results
-        print("\n10. RESULTS")
-        try:
+        async def results():
             results = await event.results.get()
-            print(f"   Found {len(results)} results")
+            lines = [f"   Found {len(results)} results"]
             for r in results[:5]:
                 formula_info = f" (Formula: {r.formula[:30]}...)" if r.formula else ""
-                print(f"   - ID {r.id}: {r.name}{formula_info}")
-        except Exception as e:
-            print(f"   ✗ Results failed: {e}")
+                lines.append(f"   - ID {r.id}: {r.name}{formula_info}")
+            return lines
 
-        # Timing Points
-        print("\n11. TIMING POINTS")
-        try:
+        async def timingpoints():
             timingpoints = await event.timingpoints.get()
-            print(f"   Found {len(timingpoints)} timing points")
-            for tp in timingpoints[:5]:
-                print(f"   - {tp.name} (Type: {tp.type}, OrderPos: {tp.order_pos})")
-        except Exception as e:
-            print(f"   ✗ Timing points failed: {e}")
+            lines = [f"   Found {len(timingpoints)} timing points"]
+            lines.extend(
+                f"   - {tp.name} (Type: {tp.type}, OrderPos: {tp.order_pos})"
+                for tp in timingpoints[:5]
+            )
+            return lines
 
-        # Timing Point Rules
-        print("\n12. TIMING POINT RULES")
-        try:
+        async def timingpointrules():
             rules = await event.timingpointrules.get()
-            print(f"   Found {len(rules)} timing point rules")
-            for r in rules[:5]:
-                print(f"   - ID {r.id}: {r.timing_point} (Decoder: {r.decoder_id})")
-        except Exception as e:
-            print(f"   ✗ Timing point rules failed: {e}")
+            lines = [f"   Found {len(rules)} timing point rules"]
+            lines.extend(
+                f"   - ID {r.id}: {r.timing_point} (Decoder: {r.decoder_id})" for r in rules[:5]
+            )
+            return lines
 
-        # Lists
-        print("\n13. LISTS")
-        try:
+        async def lists():
             list_names = await event.lists.names()
-            print(f"   Found {len(list_names)} lists")
-            for name in list_names[:5]:
-                print(f"   - {name}")
-        except Exception as e:
-            print(f"   ✗ Lists failed: {e}")
+            lines = [f"   Found {len(list_names)} lists"]
+            lines.extend(f"   - {name}" for name in list_names[:5])
+            return lines
 
-        # Exporters
-        print("\n14. EXPORTERS")
-        try:
+        async def exporters():
             exporters = await event.exporters.get()
-            print(f"   Found {len(exporters)} exporters")
-            for ex in exporters[:5]:
-                print(f"   - ID {ex.id}: {ex.name} ({ex.destination_type})")
-        except Exception as e:
-            print(f"   ✗ Exporters failed: {e}")
+            lines = [f"   Found {len(exporters)} exporters"]
+            lines.extend(
+                f"   - ID {ex.id}: {ex.name} ({ex.destination_type})" for ex in exporters[:5]
+            )
+            return lines
 
-        # Vouchers
-        print("\n15. VOUCHERS")
-        try:
+        async def vouchers():
             vouchers = await event.vouchers.get()
-            print(f"   Found {len(vouchers)} vouchers")
-            for v in vouchers[:5]:
-                print(f"   - {v.code}: {v.amount} ({v.type.name})")
-        except Exception as e:
-            print(f"   ✗ Vouchers failed: {e}")
+            lines = [f"   Found {len(vouchers)} vouchers"]
+            lines.extend(f"   - {v.code}: {v.amount} ({v.type.name})" for v in vouchers[:5])
+            return lines
 
-        # Registrations
-        print("\n16. REGISTRATIONS")
-        try:
+        async def registrations():
             reg_names = await event.registrations.names()
-            print(f"   Found {len(reg_names)} registration forms: {reg_names}")
+            lines = [f"   Found {len(reg_names)} registration forms: {reg_names}"]
             if reg_names:
                 reg = await event.registrations.get(reg_names[0])
-                print(f"   First reg '{reg.name}':")
-                print(f"     - Enabled: {reg.enabled}")
-                print(f"     - Steps: {len(reg.steps)}")
-                print(f"     - Payment methods: {len(reg.payment_methods)}")
-        except Exception as e:
-            print(f"   ✗ Registrations failed: {e}")
+                lines.append(f"   First reg '{reg.name}':")
+                lines.append(f"     - Enabled: {reg.enabled}")
+                lines.append(f"     - Steps: {len(reg.steps)}")
+                lines.append(f"     - Payment methods: {len(reg.payment_methods)}")
+            return lines
 
-        # Email templates
-        print("\n17. EMAIL TEMPLATES")
-        try:
+        async def email_templates():
             email_names = await event.email_templates.names()
-            print(f"   Found {len(email_names)} templates")
-            for name in email_names[:5]:
-                print(f"   - {name}")
-        except Exception as e:
-            print(f"   ✗ Email templates failed: {e}")
+            lines = [f"   Found {len(email_names)} templates"]
+            lines.extend(f"   - {name}" for name in email_names[:5])
+            return lines
 
-        # Chip file
-        print("\n18. CHIP FILE")
-        try:
+        async def chipfile():
             chips = await event.chipfile.get()
-            print(f"   Found {len(chips)} chip file entries")
-            for c in chips[:3]:
-                print(f"   - {c.transponder} -> {c.identification}")
-        except Exception as e:
-            print(f"   ✗ Chip file failed: {e}")
+            lines = [f"   Found {len(chips)} chip file entries"]
+            lines.extend(f"   - {c.transponder} -> {c.identification}" for c in chips[:3])
+            return lines
 
-        # Data count (participants)
-        print("\n19. PARTICIPANTS COUNT")
-        try:
+        async def participants_count():
             count = await event.data.count()
-            print(f"   Total participants: {count}")
-        except Exception as e:
-            print(f"   ✗ Count failed: {e}")
+            return [f"   Total participants: {count}"]
 
-        # Data list (sample participants)
-        print("\n20. PARTICIPANT DATA (first 5)")
-        try:
+        async def participant_data():
             data = await event.data.list(
                 fields=["Bib", "Firstname", "Lastname", "Contest", "Status"],
                 limit_to=5
             )
-            for row in data:
-                print(f"   Bib {row[0]}: {row[1]} {row[2]} (Contest: {row[3]}, Status: {row[4]})")
-        except Exception as e:
-            print(f"   ✗ Data list failed: {e}")
+            return [
+                f"   Bib {row[0]}: {row[1]} {row[2]} (Contest: {row[3]}, Status: {row[4]})"
+                for row in data
+            ]
 
-        # Times (for first participant with bib)
-        print("\n21. TIMES (first participant)")
-        try:
+        async def times():
+            lines = []
             data = await event.data.list(fields=["Bib"], limit_to=1)
             if data and data[0][0]:
                 bib = int(data[0][0])
                 times = await event.times.get(Identifier.by_bib(bib))
-                print(f"   Times for Bib {bib}: {len(times)} entries")
-                for t in times[:3]:
-                    print(f"   - Result {t.result}: {t.time_text}")
-        except Exception as e:
-            print(f"   ✗ Times failed: {e}")
+                lines.append(f"   Times for Bib {bib}: {len(times)} entries")
+                lines.extend(f"   - Result {t.result}: {t.time_text}" for t in times[:3])
+            return lines
 
-        # Raw Data count
-        print("\n22. RAW DATA")
-        try:
+        async def rawdata():
             count = await event.rawdata.count(Identifier.by_filter(""))
-            print(f"   Total raw data entries: {count}")
+            lines = [f"   Total raw data entries: {count}"]
             distinct = await event.rawdata.distinct_values()
-            print(f"   Decoder IDs: {distinct.decoder_id[:3]}")
-        except Exception as e:
-            print(f"   ✗ Raw data failed: {e}")
+            lines.append(f"   Decoder IDs: {distinct.decoder_id[:3]}")
+            return lines
 
-        # History (for first participant)
-        print("\n23. HISTORY (first participant)")
-        try:
+        async def history():
+            lines = []
             data = await event.data.list(fields=["Bib"], limit_to=1)
             if data and data[0][0]:
                 bib = int(data[0][0])
                 history = await event.history.get(Identifier.by_bib(bib))
-                print(f"   History for Bib {bib}: {len(history)} entries")
-                for h in history[:3]:
-                    print(f"   - {h.field_name}: {h.old_value} -> {h.new_value}")
-        except Exception as e:
-            print(f"   ✗ History failed: {e}")
+                lines.append(f"   History for Bib {bib}: {len(history)} entries")
+                lines.extend(
+                    f"   - {h.field_name}: {h.old_value} -> {h.new_value}" for h in history[:3]
+                )
+            return lines
 
-        # User Rights
-        print("\n24. USER RIGHTS")
-        try:
+        async def user_rights():
             rights = await api.user_rights_get(event_id)
-            print(f"   Found {len(rights)} users with rights")
-            for r in rights[:3]:
-                print(f"   - {r.user_name} (ID: {r.user_id})")
-        except Exception as e:
-            print(f"   ✗ User rights failed: {e}")
+            lines = [f"   Found {len(rights)} users with rights"]
+            lines.extend(f"   - {r.user_name} (ID: {r.user_id})" for r in rights[:3])
+            return lines
+
+        checks = [
+            ("USER INFO", "User info", user_info),
+            ("EVENT LIST", "Event list", event_list),
+            ("SETTINGS", "Settings", settings),
+            ("CONTESTS", "Contests", contests),
+            ("AGE GROUPS", "Age groups", agegroups),
+            ("BIB RANGES", "Bib ranges", bibranges),
+            ("CUSTOM FIELDS", "Custom fields", customfields),
+            ("ENTRY FEES", "Entry fees", entryfees),
+            ("RESULTS", "Results", results),
+            ("TIMING POINTS", "Timing points", timingpoints),
+            ("TIMING POINT RULES", "Timing point rules", timingpointrules),
+            ("LISTS", "Lists", lists),
+            ("EXPORTERS", "Exporters", exporters),
+            ("VOUCHERS", "Vouchers", vouchers),
+            ("REGISTRATIONS", "Registrations", registrations),
+            ("EMAIL TEMPLATES", "Email templates", email_templates),
+            ("CHIP FILE", "Chip file", chipfile),
+            ("PARTICIPANTS COUNT", "Count", participants_count),
+            ("PARTICIPANT DATA (first 5)", "Data list", participant_data),
+            ("TIMES (first participant)", "Times", times),
+            ("RAW DATA", "Raw data", rawdata),
+            ("HISTORY (first participant)", "History", history),
+            ("USER RIGHTS", "User rights", user_rights),
+        ]
+
+        # Checks are independent, so run them concurrently and print in order
+        sem = asyncio.Semaphore(MAX_CONCURRENT)
+        outputs = await asyncio.gather(
+            *(
+                run_check(sem, f"{i}. {title}", failure, check)
+                for i, (title, failure, check) in enumerate(checks, start=2)
+            )
+        )
+        for lines in outputs:
+            print("\n".join(lines))
 
         print("\n" + "=" * 60)
         print("LIVE TEST COMPLETE")
-        print(f"Tested {24} API endpoint groups")
+        print(f"Tested {len(checks) + 1} API endpoint groups")
 
 
 if __name__ == "__main__":
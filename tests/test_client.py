@@ -0,0 +1,77 @@
+"""Tests for the raceresult HTTP client."""
+
+from decimal import Decimal
+
+import httpx
+import pytest
+
+from raceresult.client import RaceResultClient
+
+
+def _recording_client(requests: list[httpx.Request]) -> RaceResultClient:
+    """Create a client whose requests are captured instead of sent."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, content=b"")
+
+    client = RaceResultClient()
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+class TestPost:
+    """Tests for RaceResultClient.post request bodies."""
+
+    async def test_json_body(self):
+        """Test that dict bodies are sent as JSON with numbers kept as numbers."""
+        requests: list[httpx.Request] = []
+        client = _recording_client(requests)
+        await client.post("event123", "part/savefields", data={"Bib": 1, "Fee": 1.5, "Name": "Ä"})
+        assert requests[0].headers["Content-Type"] == "application/json"
+        assert requests[0].content == b'{"Bib": 1, "Fee": 1.5, "Name": "\\u00c4"}'
+
+    async def test_decimal_body_rejected(self):
+        """Test that Decimal values are not silently sent as JSON strings."""
+        requests: list[httpx.Request] = []
+        client = _recording_client(requests)
+        with pytest.raises(TypeError):
+            await client.post("event123", "part/savefields", data={"Fee": Decimal("1.5")})
+        assert requests == []
+
+
+class TestSerializeParam:
+    """Tests for RaceResultClient._serialize_param."""
+
+    def test_int_enum(self):
+        """Test that IntEnum members are sent as their number."""
+        from raceresult.models.payment import PaymentConstants, PaymentMethodType
+
+        client = RaceResultClient()
+        assert client._serialize_param(PaymentMethodType.BAR) == "5"
+        assert client._serialize_param(PaymentConstants.PM_BAR) == "5"
+
+
+class TestBuildUrl:
+    """Tests for RaceResultClient._build_url."""
+
+    def test_query_encoding(self):
+        """Test None filtering and bool, list and str encoding in the query string."""
+        client = RaceResultClient()
+        url = client._build_url(
+            "event123",
+            "data/list",
+            {"fields": ["Bib", "Name"], "filter": "[Bib]>1 & x", "skip": None, "v2": True, "n": 0},
+        )
+        assert url == (
+            "https://events.raceresult.com/_event123/api/data/list"
+            "?fields=Bib%2CName&filter=%5BBib%5D%3E1+%26+x&v2=true&n=0"
+        )
+
+    def test_without_params(self):
+        """Test URLs without event or query parameters."""
+        client = RaceResultClient(https=False)
+        assert client._build_url(None, "public/login") == "http://events.raceresult.com/api/public/login"
+        assert client._build_url("e", "data/count", {"filter": None}) == (
+            "http://events.raceresult.com/_e/api/data/count"
+        )
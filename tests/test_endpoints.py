@@ -0,0 +1,184 @@
+"""Tests for raceresult endpoints."""
+
+from decimal import Decimal
+from typing import Any
+
+import pytest
+
+from raceresult.client import RaceResultClient
+from raceresult.endpoints.contests import ContestsEndpoint
+from raceresult.endpoints.data import DataEndpoint
+from raceresult.endpoints.participants import Identifier, ParticipantsEndpoint
+from raceresult.endpoints.registrations import RegistrationsEndpoint
+from raceresult.endpoints.results import ResultsEndpoint
+from raceresult.endpoints.settings import SettingsEndpoint
+from raceresult.endpoints.times import TimesEndpoint
+from raceresult.endpoints.timingpointrules import TimingPointRulesEndpoint
+from raceresult.endpoints.vouchers import VouchersEndpoint
+from raceresult.models.timing import Passing
+
+
+class StubClient:
+    """Client stub that serves data/list rows and records the query params."""
+
+    def __init__(self, rows: list[list[Any]]):
+        self.rows = rows
+        self.calls: list[dict[str, Any]] = []
+
+    async def get_json(self, event_id: str, cmd: str, params: dict[str, Any]) -> Any:
+        self.calls.append(params)
+        start = params["limitFrom"]
+        end = params["limitTo"] or len(self.rows)
+        return self.rows[start:end]
+
+
+class FakeClient(RaceResultClient):
+    """Client whose get/post return a canned body and record the request."""
+
+    def __init__(self, body: bytes = b""):
+        super().__init__()
+        self.body = body
+        self.calls: list[tuple[str, Any]] = []
+
+    async def get(
+        self, event_id: str | None, cmd: str, params: dict[str, Any] | None = None
+    ) -> bytes:
+        self.calls.append((cmd, params))
+        return self.body
+
+    async def post(
+        self,
+        event_id: str | None,
+        cmd: str,
+        params: dict[str, Any] | None = None,
+        data: Any = None,
+        content_type: str = "application/json",
+    ) -> bytes:
+        self.calls.append((cmd, data))
+        return self.body
+
+
+class TestDataColumns:
+    """Tests for DataEndpoint.columns."""
+
+    async def test_transposes_rows(self):
+        """Test that rows are returned as one list per field."""
+        data = DataEndpoint(StubClient([[1, "Anna"], [2, "Ben"]]), "event123")
+        columns = await data.columns(["Bib", "Firstname"])
+        assert columns == {"Bib": [1, 2], "Firstname": ["Anna", "Ben"]}
+
+    async def test_empty(self):
+        """Test that every field maps to an empty list when there are no rows."""
+        data = DataEndpoint(StubClient([]), "event123")
+        assert await data.columns(["Bib", "Firstname"]) == {"Bib": [], "Firstname": []}
+
+
+class TestDataIterRows:
+    """Tests for DataEndpoint.iter_rows."""
+
+    async def test_pages(self):
+        """Test that rows are fetched in page_size windows until a short page."""
+        client = StubClient([[bib] for bib in range(5)])
+        data = DataEndpoint(client, "event123")
+        rows = [row async for row in data.iter_rows(["Bib"], page_size=2)]
+        assert rows == [[0], [1], [2], [3], [4]]
+        assert [(c["limitFrom"], c["limitTo"]) for c in client.calls] == [(0, 2), (2, 4), (4, 6)]
+
+    async def test_stops_on_empty_page(self):
+        """Test that a full last page is followed by one empty request."""
+        client = StubClient([[bib] for bib in range(4)])
+        data = DataEndpoint(client, "event123")
+        rows = [row async for row in data.iter_rows(["Bib"], page_size=2)]
+        assert len(rows) == 4
+        assert len(client.calls) == 3
+
+    async def test_invalid_page_size(self):
+        """Test that a non-positive page_size raises ValueError."""
+        data = DataEndpoint(StubClient([]), "event123")
+        with pytest.raises(ValueError):
+            async for _ in data.iter_rows(["Bib"], page_size=0):
+                pass
+
+
+class TestTimes:
+    """Tests for TimesEndpoint."""
+
+    async def test_get(self):
+        """Test validating a times/get body directly from bytes."""
+        body = b'[{"PID": 7, "Result": 1, "DecimalTime": 3600.25, "TimeText": "1:00:00"}]'
+        times = await TimesEndpoint(FakeClient(body), "event123").get(Identifier.by_bib(7))
+        assert times[0].pid == 7
+        assert times[0].decimal_time == Decimal("3600.25")
+
+    @pytest.mark.parametrize("body", [b"null", b"[]"])
+    async def test_get_empty(self, body):
+        """Test that a null or empty times/get body gives an empty list."""
+        assert await TimesEndpoint(FakeClient(body), "event123").get(Identifier.by_bib(7)) == []
+
+    async def test_add(self):
+        """Test parsing a times/add response with null Fields."""
+        client = FakeClient(b'[{"Status": 1, "Time": 3600.5, "ResultID": 2, "Fields": null}]')
+        items = await TimesEndpoint(client, "event123").add([Passing(transponder="ABC123")])
+        assert items[0].status == 1
+        assert items[0].time == Decimal("3600.5")
+        assert items[0].result_id == 2
+        assert items[0].fields == {}
+        assert client.calls[0][1].startswith(b'[{"Transponder":"ABC123"')
+
+    @pytest.mark.parametrize("body", [b"", b"null", b"[]"])
+    async def test_add_empty_response(self, body):
+        """Test that an empty times/add response gives an empty list."""
+        times = TimesEndpoint(FakeClient(body), "event123")
+        assert await times.add([Passing(transponder="ABC123")]) == []
+
+
+class TestBytesDecoding:
+    """Tests for endpoints that validate response bodies directly from bytes."""
+
+    async def test_contests_get(self):
+        """Test contests/get with a list and a null body."""
+        body = b'[{"ID": 1, "Name": "5K Run", "StartTime": 36000}]'
+        contests = await ContestsEndpoint(FakeClient(body), "event123").get()
+        assert contests[0].name == "5K Run"
+        assert contests[0].start_time == Decimal(36000)
+        assert await ContestsEndpoint(FakeClient(b"null"), "event123").get() == []
+
+    async def test_results_get(self):
+        """Test results/get with a list, an empty list and a single result."""
+        results = await ResultsEndpoint(FakeClient(b'[{"ID": 3, "Name": "Finish"}]'), "e").get()
+        assert results[0].id == 3
+        assert await ResultsEndpoint(FakeClient(b"[]"), "e").get() == []
+        result = await ResultsEndpoint(FakeClient(b'{"ID": 3, "Name": "Finish"}'), "e").get_one(3)
+        assert result.name == "Finish"
+
+    async def test_participants(self):
+        """Test part/new and part/entryfee bodies."""
+        participants = ParticipantsEndpoint(FakeClient(b'{"ID": 12, "Bib": 101}'), "e")
+        created = await participants.new(bib=101)
+        assert (created.id, created.bib) == (12, 101)
+        body = b'[{"ID": 1, "Name": "Entry", "Fee": 25.5}]'
+        fees = await ParticipantsEndpoint(FakeClient(body), "e").entry_fee([101])
+        assert fees[0].fee == Decimal("25.5")
+        assert await ParticipantsEndpoint(FakeClient(b"null"), "e").entry_fee([101]) == []
+
+    async def test_registrations_get(self):
+        """Test registrations/get with null lists in the body."""
+        body = b'{"Name": "Online", "Enabled": true, "Steps": null, "PaymentMethods": null}'
+        registration = await RegistrationsEndpoint(FakeClient(body), "e").get("Online")
+        assert registration.name == "Online"
+        assert registration.steps == []
+        assert registration.payment_methods == []
+
+
+class TestEmptyBatches:
+    """Tests that batch calls with nothing to send make no request."""
+
+    async def test_no_request(self):
+        """Test the documented empty return values without a request."""
+        client = FakeClient()
+        assert await TimesEndpoint(client, "e").add([]) == []
+        assert await TimingPointRulesEndpoint(client, "e").save([]) == []
+        assert await ResultsEndpoint(client, "e").save([]) is None
+        assert await SettingsEndpoint(client, "e").save([]) is None
+        assert await VouchersEndpoint(client, "e").delete([]) is None
+        assert client.calls == []
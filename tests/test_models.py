@@ -1,5 +1,6 @@
 """Tests for raceresult models."""
 
+import json
 from datetime import date, datetime, timezone
 from decimal import Decimal
 
@@ -70,6 +71,30 @@ class TestRRDateTime:
         assert result.year == 2024
         assert result.hour == 10
 
+    def test_parse_european_format(self):
+        """Test parsing European datetime and date-only formats."""
+        from raceresult.models.types import _parse_rr_datetime
+
+        assert _parse_rr_datetime("15.06.2024 10:30:00") == datetime(
+            2024, 6, 15, 10, 30, tzinfo=timezone.utc
+        )
+        assert _parse_rr_datetime("15.06.2024") == datetime(2024, 6, 15, tzinfo=timezone.utc)
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "2024-01-01 10:00+02",
+            "2024-01-01 10:00.00",
+            "2024-06-15 25:30:00",
+            "2024-06-15 10:30:0Z",
+        ],
+    )
+    def test_parse_datetime_format_rejects_other_shapes(self, value):
+        """Test that only YYYY-MM-DD HH:MM:SS is accepted for space-separated values."""
+        from raceresult.models.types import _parse_rr_datetime
+
+        assert _parse_rr_datetime(value) is None
+
 
 class TestRRDecimal:
     """Tests for RRDecimal type."""
@@ -113,6 +138,13 @@ class TestContest:
         assert contest.name == "5K Run"
         assert contest.name_short == "5K"
 
+    def test_from_json_bytes(self):
+        """Test that validating JSON bytes matches validating the parsed dict."""
+        raw = b'{"ID": 1, "Name": "5K Run", "NameShort": "5K", "Day": 1, "StartTime": 36000.0}'
+        contest = Contest.model_validate_json(raw)
+        assert contest == Contest.model_validate(json.loads(raw))
+        assert contest.start_time == Decimal("36000.0")
+
     def test_to_dict(self):
         """Test serializing Contest to dict."""
         contest = Contest(id=1, name="5K Run", name_short="5K")
@@ -121,6 +153,17 @@ class TestContest:
         assert data["Name"] == "5K Run"
 
 
+class TestRanking:
+    """Tests for Ranking model."""
+
+    def test_sort_spec(self):
+        """Test pairing sort expressions with descending flags."""
+        from raceresult.models.event import Ranking
+
+        ranking = Ranking(sort=["[Time]", "[Bib]"], sort_desc=[True])
+        assert ranking.sort_spec() == [("[Time]", True), ("[Bib]", False)]
+
+
 class TestParticipant:
     """Tests for Participant model."""
 
@@ -134,6 +177,13 @@ class TestParticipant:
         p = Participant(street="123 Main St", zip="12345", city="Springfield")
         assert p.full_address == "123 Main St, 12345 Springfield"
 
+    def test_get_boolean(self):
+        """Test reading bits of the booleans field."""
+        p = Participant(booleans=0b101)
+        assert p.get_boolean(0) is True
+        assert p.get_boolean(1) is False
+        assert p.get_boolean(2) is True
+
 
 class TestRegistration:
     """Tests for Registration model."""
@@ -154,6 +204,26 @@ class TestRegistration:
         reg = Registration(name="Test", enabled=False)
         assert reg.is_active() is False
 
+    def test_is_active_at(self):
+        """Test is_active against an explicit reference time."""
+        reg = Registration(
+            name="Test",
+            enabled=True,
+            enabled_from=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            enabled_to=datetime(2024, 12, 31, tzinfo=timezone.utc),
+        )
+        assert reg.is_active(now=datetime(2024, 6, 1, tzinfo=timezone.utc)) is True
+        assert reg.is_active(now=datetime(2025, 6, 1, tzinfo=timezone.utc)) is False
+
+    def test_null_lists(self):
+        """Test that null list fields from the API become empty lists."""
+        reg = Registration.model_validate(
+            {"Steps": [{"Elements": [{"Styles": None, "Children": None}]}], "AfterSave": None}
+        )
+        assert reg.after_save == []
+        assert reg.steps[0].elements[0].styles == []
+        assert reg.steps[0].elements[0].children == []
+
 
 class TestVoucher:
     """Tests for Voucher model."""
@@ -178,6 +248,14 @@ class TestVoucher:
         )
         assert voucher.is_valid() is False
 
+    def test_is_valid_at(self):
+        """Test is_valid against an explicit reference time."""
+        voucher = Voucher(
+            code="TEST123",
+            valid_until=datetime(2020, 1, 1, tzinfo=timezone.utc),
+        )
+        assert voucher.is_valid(now=datetime(2019, 6, 1, tzinfo=timezone.utc)) is True
+
 
 class TestEmailTemplate:
     """Tests for EmailTemplate model."""
@@ -205,3 +283,57 @@ class TestChipFileEntry:
         entry = ChipFileEntry(transponder="ABC123", identification="42")
         assert entry.transponder == "ABC123"
         assert entry.identification == "42"
+
+
+class TestPassing:
+    """Tests for Passing model."""
+
+    def test_decode_passings_json(self):
+        """Test decoding a JSON array of passings."""
+        from raceresult.models.timing import decode_passings_json
+
+        passings = decode_passings_json(
+            b'[{"Transponder": "ABC123", "Hits": 3, "Battery": 3.1, "IsMarker": false}]'
+        )
+        assert len(passings) == 1
+        assert passings[0].transponder == "ABC123"
+        assert passings[0].hits == 3
+        assert passings[0].battery == Decimal("3.1")
+
+    def test_encode_passings_json(self):
+        """Test that encoded passings use API names and decode back unchanged."""
+        from raceresult.models import decode_passings_json, encode_passings_json
+        from raceresult.models.timing import Passing
+
+        passings = [Passing(transponder="ABC123", hits=3, battery=Decimal("3.1"))]
+        data = encode_passings_json(passings)
+        assert json.loads(data)[0]["Transponder"] == "ABC123"
+        assert decode_passings_json(data) == passings
+
+
+class TestUserRight:
+    """Tests for UserRight model."""
+
+    def test_has_right(self):
+        """Test has_right against specific and wildcard rights."""
+        from raceresult.models.public import UserRight
+
+        right = UserRight(rights={"data": ["read"], "lists": ["*"]})
+        assert right.has_right("data") is True
+        assert right.has_right("data.read") is True
+        assert right.has_right("data.write") is False
+        assert right.has_right("lists.edit") is True
+        assert right.has_right("times.read") is False
+        assert UserRight(rights={"*": []}).has_right("times.read") is True
+
+    def test_has_right_after_in_place_edit(self):
+        """Test that editing rights in place is reflected by has_right."""
+        from raceresult.models.public import UserRight
+
+        right = UserRight(rights={"data": ["read"]})
+        assert right.has_right("times.read") is False
+        right.rights["times"] = ["read"]
+        assert right.has_right("times.read") is True
+        assert right.has_right("data.write") is False
+        right.rights["data"].append("write")
+        assert right.has_right("data.write") is True